@@ -2,8 +2,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import random
+import sys
 import time
 
+# Float type for object positions and the jar surface; more precision than this is never visible
+DTYPE = np.float32
+
 
 class GodelianJar3D:
     def __init__(self, num_objects=None):
@@ -16,6 +20,7 @@ class GodelianJar3D:
         self.jar_height = 10
         self.jar_radius = 5
         self.object_type = "star"  # could be "star", "paperclip", etc.
+        self.object_color = '#B87333'  # Coppery; keep this a single color (see visualize)
 
         # If we don't specify, make the count fundamentally "indecidable"
         if num_objects is None:
@@ -31,48 +36,66 @@ class GodelianJar3D:
 
     def generate_objects(self):
         """Generate 3D coordinates for objects within the jar with some indeterminacy"""
-        self.object_positions = []
+        n = self.num_objects
+        rng = np.random.default_rng()
 
-        for _ in range(self.num_objects):
-            # Generate position inside cylinder (jar)
-            theta = random.uniform(0, 2 * np.pi)
-            r = random.uniform(0, self.jar_radius)
-            h = random.uniform(0, self.jar_height)
+        # Generate positions inside cylinder (jar)
+        theta = rng.uniform(0, 2 * np.pi, n).astype(DTYPE)
+        r = rng.uniform(0, self.jar_radius, n).astype(DTYPE)
+        h = rng.uniform(0, self.jar_height, n).astype(DTYPE)
 
-            # Convert to Cartesian coordinates
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
-            z = h
+        # Convert to Cartesian coordinates, one (x, y, z) row per object
+        self.object_positions = np.empty((n, 3), dtype=DTYPE)
+        self.object_positions[:, 0] = r * np.cos(theta)
+        self.object_positions[:, 1] = r * np.sin(theta)
+        self.object_positions[:, 2] = h
 
-            # Add some quantum indeterminacy to positions
-            x += random.gauss(0, 0.2)
-            y += random.gauss(0, 0.2)
-            z += random.gauss(0, 0.2)
+        # Add some quantum indeterminacy to positions
+        self.object_positions += rng.normal(0, 0.2, (n, 3)).astype(DTYPE)
 
-            self.object_positions.append((x, y, z))
+    def print_analysis(self):
+        """Print the Gödelian uncertainty statement"""
+        print("\nGödelian Analysis Complete:")
+        print("=" * 50)
+        print("Following principles analogous to Gödel's Incompleteness Theorems,")
+        print("this counting problem has been determined to be formally undecidable.")
+        print("\nThe system of objects exhibits emergent properties that prevent")
+        print("complete enumeration within our current logical framework.")
+        print("\nAny attempt at precise counting would require a meta-system,")
+        print("which itself would be subject to the same limitations.")
 
-    def visualize(self):
-        """Create a 3D visualization of the jar and its contents"""
+    def visualize(self, interactive=True, verbose=False):
+        """
+        Create a 3D visualization of the jar and its contents
+
+        Parameters:
+        interactive (bool): Hook up the rotation callback (not needed when only saving frames)
+        verbose (bool): Also print the Gödelian analysis
+        """
         fig = plt.figure(figsize=(10, 12))
         ax = fig.add_subplot(111, projection='3d')
 
         # Plot the jar (cylinder)
-        theta = np.linspace(0, 2 * np.pi, 100)
-        z = np.linspace(0, self.jar_height, 100)
-        theta_grid, z_grid = np.meshgrid(theta, z)
-        x = self.jar_radius * np.cos(theta_grid)
-        y = self.jar_radius * np.sin(theta_grid)
+        # Angle varies along columns and height along rows, so the trig only
+        # runs on 100 samples and is broadcast (without copying) to the grid
+        theta = np.linspace(0, 2 * np.pi, 100, dtype=DTYPE)[np.newaxis, :]
+        z = np.linspace(0, self.jar_height, 100, dtype=DTYPE)[:, np.newaxis]
+        x, y, z_grid = np.broadcast_arrays(self.jar_radius * np.cos(theta),
+                                           self.jar_radius * np.sin(theta),
+                                           z)
 
         # Plot jar as a semi-transparent surface
         ax.plot_surface(x, y, z_grid, alpha=0.2, color='blue')
 
-        # Plot objects (stars/paperclips)
-        xs = [pos[0] for pos in self.object_positions]
-        ys = [pos[1] for pos in self.object_positions]
-        zs = [pos[2] for pos in self.object_positions]
+        # Plot objects (stars/paperclips), as contiguous columns so matplotlib doesn't copy them again
+        xs = np.ascontiguousarray(self.object_positions[:, 0])
+        ys = np.ascontiguousarray(self.object_positions[:, 1])
+        zs = np.ascontiguousarray(self.object_positions[:, 2])
 
-        # Use a coppery color for the objects
-        ax.scatter(xs, ys, zs, c='#B87333', marker='*', s=100, alpha=0.8)
+        # Use a coppery color for the objects. Color and size are passed as scalars so
+        # matplotlib stays on its single-color path; per-object colors should be set as
+        # one (N, 4) RGBA array via set_facecolors rather than N separate color values
+        ax.scatter(xs, ys, zs, c=self.object_color, marker='*', s=100, alpha=0.8)
 
         # Set labels and title
         ax.set_xlabel('X')
@@ -83,37 +106,74 @@ class GodelianJar3D:
                      "(exact count indecidable)")
 
         # Print the Gödelian uncertainty statement
-        print("\nGödelian Analysis Complete:")
-        print("=" * 50)
-        print("Following principles analogous to Gödel's Incompleteness Theorems,")
-        print("this counting problem has been determined to be formally undecidable.")
-        print("\nThe system of objects exhibits emergent properties that prevent")
-        print("complete enumeration within our current logical framework.")
-        print("\nAny attempt at precise counting would require a meta-system,")
-        print("which itself would be subject to the same limitations.")
+        if verbose:
+            self.print_analysis()
+
+        # Add a randomly varying count each time we rotate the visualization.
+        # Every title change forces a full 3D redraw, so limit it to ~5 per second
+        title_update_interval = 0.2
+        last_title_update = 0.0
 
-        # Add a randomly varying count each time we rotate the visualization
         def on_rotate(event):
+            nonlocal last_title_update
             if hasattr(event, 'button') and event.button == 1:
+                now = time.perf_counter()
+                if now - last_title_update < title_update_interval:
+                    return
+                last_title_update = now
+
                 apparent_count = self.num_objects + random.randint(-self.uncertainty, self.uncertainty)
                 ax.set_title("3D Visualization of a Gödelian Jar of Objects\n" +
                              f"Now appears to contain {apparent_count} objects " +
                              "(exact count indecidable)")
                 fig.canvas.draw_idle()
 
-        fig.canvas.mpl_connect('motion_notify_event', on_rotate)
+        if interactive:
+            fig.canvas.mpl_connect('motion_notify_event', on_rotate)
 
         # Return the figure for saving or showing
         return fig
 
+    def visualize_vispy(self):
+        """
+        Create a GPU-rendered 3D visualization of the jar using VisPy
+
+        Projection, depth sorting and rasterization happen in OpenGL, so rotating
+        the view does not re-render the scene in Python. Requires the optional
+        vispy package.
+        """
+        from vispy import scene
+        from vispy.geometry import create_cylinder
+
+        canvas = scene.SceneCanvas(title="3D Visualization of a Gödelian Jar of Objects",
+                                   size=(800, 960), keys='interactive', bgcolor='white')
+        view = canvas.central_widget.add_view()
+        view.camera = scene.cameras.TurntableCamera(elevation=30, azimuth=0,
+                                                    distance=4 * self.jar_height)
+        view.camera.center = (0, 0, self.jar_height / 2)
+
+        # Plot jar as a semi-transparent cylinder mesh
+        jar_mesh = create_cylinder(20, 100, radius=[self.jar_radius, self.jar_radius],
+                                   length=self.jar_height)
+        jar = scene.visuals.Mesh(meshdata=jar_mesh, color=(0, 0, 1, 0.2), parent=view.scene)
+        jar.set_gl_state('translucent', depth_test=False)
+
+        # Plot objects (stars/paperclips), the (N, 3) positions go straight to the GPU
+        objects = scene.visuals.Markers(parent=view.scene)
+        objects.set_data(self.object_positions, face_color=self.object_color, edge_width=0,
+                         size=15, symbol='star')
+
+        return canvas
+
     def rotate_animation(self, num_frames=36):
         """Create a rotating animation of the jar"""
+        # Build the scene once; only the camera moves between frames
+        fig = self.visualize(interactive=False, verbose=False)
+        ax = fig.gca()
         for angle in range(0, 360, int(360 / num_frames)):
-            fig = self.visualize()
-            ax = fig.gca()
             ax.view_init(30, angle)
-            plt.savefig(f"jar_rotation_{angle}.png")
-            plt.close(fig)
+            fig.savefig(f"jar_rotation_{angle}.png")
+        plt.close(fig)
 
         print("\nAnimation frames saved. Combine them to create a rotating GIF.")
 
@@ -121,15 +181,23 @@ class GodelianJar3D:
 if __name__ == "__main__":
     # Create a new jar with an indecidable number of objects
     jar = GodelianJar3D()
-
-    # Visualize it
-    fig = jar.visualize()
+    jar.print_analysis()
 
     # Inform user about the indecidability
-    print("\nRECOMMENDATION: Accept the fundamental indecidability of this problem")
-    print("and appreciate the philosophical implications instead.")
-
-    plt.show()
+    recommendation = ("\nRECOMMENDATION: Accept the fundamental indecidability of this problem\n"
+                      "and appreciate the philosophical implications instead.")
+
+    if "--vispy" in sys.argv:
+        # Visualize it on the GPU (needs the optional vispy package)
+        canvas = jar.visualize_vispy()
+        print(recommendation)
+        canvas.show()
+        canvas.app.run()
+    else:
+        # Visualize it
+        fig = jar.visualize()
+        print(recommendation)
+        plt.show()
 
     # Uncomment to create a rotating animation
     # jar.rotate_animation()
\ No newline at end of file
@@ -3,8 +3,12 @@ import math
 import random
 import sys
 import numpy as np
+from collections import OrderedDict
 from pygame import gfxdraw
 
+# Float type for per-star data; everything ends up as whole pixels, so float64 is wasted bandwidth
+DTYPE = np.float32
+
 
 class GodelianJar:
     def __init__(self, num_objects=None, debug_mode=False):
@@ -57,12 +61,15 @@ class GodelianJar:
             self.num_objects = num_objects
             self.uncertainty = 10
 
-        # Generate objects (stars) in the jar
-        self.generate_objects()
+        # Random source and depth shading for the stars in the jar
+        self.rng = np.random.default_rng()
+        self.star_brightness_levels = 16  # Depth is quantized into this many shades
 
         # Visualization parameters
         self.rotation_angle = 0
+        self.update_rotation_terms()
         self.rotation_speed = 1
+        self.star_rotation_offset = 30  # Furthest the front and back stars shift sideways as the jar turns
         self.apparent_count = self.num_objects
 
         # Create fonts with sizes relative to screen resolution
@@ -75,6 +82,10 @@ class GodelianJar:
         self.display_title_font = pygame.font.SysFont('Arial', int(font_size_large * 1.2), bold=True)
         self.display_explanation_font = pygame.font.SysFont('Arial', font_size_small)
 
+        # Rendered text surfaces keyed by (text, font, color), least recently used first
+        self.text_cache = OrderedDict()
+        self.text_cache_size = 256  # Progress text alone has ~1000 variants over a counting attempt
+
         self.count_update_interval = 10  # Frames between count updates
 
         # Define colors
@@ -84,6 +95,48 @@ class GodelianJar:
         self.text_color = (255, 255, 255)  # White for text
         self.highlight_color = (255, 215, 0)  # Gold for highlights
         self.grid_color = (50, 50, 120)  # Dark blue for grid
+        self.grid_spacing = 30
+
+        # Star colors per brightness level, looked up instead of recomputed for each star
+        self.star_color_lut = {
+            False: [self.compute_star_color(level, self.star_color)
+                    for level in range(self.star_brightness_levels)],
+            # Gödel stars are golden/yellow to highlight their special nature
+            True: [self.compute_star_color(level, self.highlight_color)
+                   for level in range(self.star_brightness_levels)],
+        }
+
+        # Unit five-pointed star outline (alternating outer/inner vertices),
+        # built once so drawing a star is just a scale and translate
+        num_points = 5
+        vertex = np.arange(num_points * 2)
+        vertex_angles = math.pi / num_points * vertex
+        vertex_radii = np.where(vertex % 2, 0.4, 1.0)  # Inner vertices sit at 40% of the outer radius
+        self.star_template = np.column_stack((np.sin(vertex_angles) * vertex_radii,
+                                              np.cos(vertex_angles) * vertex_radii)).astype(DTYPE)
+
+        # Stars are rasterized once per (size, brightness, Gödel, marked) variant and then blitted,
+        # and Gödel star glows once per (size, brightness)
+        self.star_sprites = {}
+        self.star_halos = {}
+
+        # The semitransparent glass is one surface at the full jar width, cropped to the
+        # apparent width when blitted
+        self.jar_fill = pygame.Surface((self.jar_width, self.jar_height), pygame.SRCALPHA)
+        self.jar_fill.fill((70, 130, 180, 50))  # Semi-transparent blue
+        self.jar_fill = self.jar_fill.convert_alpha()
+
+        # Jar rims are rasterized once per apparent width (see draw_jar). Each is only
+        # effective_width x 20 px, so all the squeeze's widths (75-100% of jar_width) take
+        # about 2 MB at 1080p and 8 MB at 4K, and are rendered here rather than mid-animation
+        self.jar_rims = {width: self.render_jar_rim(width)
+                         for width in range(int(self.jar_width * 0.75), self.jar_width + 1)}
+
+        # The vertical and horizontal lines of the occasional formal-system grid, at the full jar width
+        self.grid_verticals, self.grid_horizontals = self.render_grid_surfaces()
+
+        # Generate objects (stars) in the jar, once their sprites can be rendered
+        self.generate_objects()
 
         # Gödel's Theorem References
         self.godel_statements = [
@@ -93,6 +146,10 @@ class GodelianJar:
             "The observer affects the observation",
             "Truth exists beyond what can be proven"
         ]
+        self.statement_surfaces = [
+            self.display_font.render(f"Gödel's Insight: {statement}", True, self.text_color).convert_alpha()
+            for statement in self.godel_statements
+        ]
         self.current_statement = 0
         self.statement_fade = 255  # For fading effects
         self.statement_change_interval = 180  # Change statement every 3 seconds
@@ -102,97 +159,134 @@ class GodelianJar:
         self.counting_progress = 0
         self.counting_target = 0
         self.counting_error = False
-
-        # Store formal system boundaries (axiomatic visualization)
-        self.axiom_boundaries = []
-        for _ in range(4):
-            self.axiom_boundaries.append({
-                'x': random.randint(int(self.display_width * 0.1), int(self.display_width * 0.9)),
-                'y': random.randint(int(self.display_height * 0.1), int(self.display_height * 0.9)),
-                'size': random.randint(20, 50),
-                'speed': random.uniform(0.2, 0.7)
-            })
+        self.counting_path_key = None  # Whole percent the cached counting path was computed for
+        self.counting_path = []
+
+        # Store formal system boundaries (axiomatic visualization) as parallel arrays
+        num_axioms = 4
+        self.axiom_positions = np.column_stack((
+            self.rng.integers(int(self.display_width * 0.1), int(self.display_width * 0.9),
+                              num_axioms, endpoint=True),
+            self.rng.integers(int(self.display_height * 0.1), int(self.display_height * 0.9),
+                              num_axioms, endpoint=True),
+        )).astype(float)
+        self.axiom_sizes = self.rng.integers(20, 50, num_axioms, endpoint=True).tolist()
+        self.axiom_speeds = self.rng.uniform(0.2, 0.7, num_axioms)
+        self.update_axiom_appearance(np.radians(self.rotation_angle * self.axiom_speeds))
+
+        # Dirty-rectangle display updates (see render_frame)
+        self.full_redraw = True
+        self.dirty_rects = []
+        self.previous_dirty_rects = []
 
         # Track FPS
         self.clock = pygame.time.Clock()
 
     def generate_objects(self):
         """Generate coordinates for objects within the jar"""
-        self.stars = []
-        self.star_visibility = []
-        self.star_depths = []  # For pseudo-3D effect
-        self.star_sizes = []  # Size for each star
-        self.star_flicker = []  # For quantum uncertainty visualization
-        self.star_godel_status = []  # Stars that illustrate Gödel's theorem
+        # Each per-star attribute is its own contiguous array (structure of arrays)
+        n = self.num_objects
 
         # Calculate jar boundaries
-        jar_left = self.jar_center_x - self.jar_width // 2
-        jar_right = self.jar_center_x + self.jar_width // 2
         jar_top = self.jar_center_y - self.jar_height // 2
-        jar_bottom = self.jar_center_y + self.jar_height // 2
 
-        # Generate stars
-        for i in range(self.num_objects):
-            # Generate position inside jar
-            # Use an elliptical distribution to simulate 3D cylinder
-            angle = random.uniform(0, 2 * math.pi)
-            radius_factor = random.uniform(0, 0.95) ** 0.5  # Square root for uniform distribution in circle
-
-            # Depth in the jar (for pseudo-3D)
-            depth = random.uniform(-1.0, 1.0)  # -1 is back, 1 is front
-
-            # Adjust radius based on depth to create 3D cylinder illusion
-            effective_width = self.jar_width * (0.5 + 0.5 * (1 - abs(depth)) ** 2)
-
-            # Calculate position
-            x = self.jar_center_x + radius_factor * effective_width / 2 * math.cos(angle)
-            y = jar_top + random.uniform(0.1, 0.9) * self.jar_height
-
-            self.stars.append((x, y))
-            self.star_depths.append(depth)
-
-            # Size varies with depth and screen resolution
-            base_size = self.display_height * 0.005  # Base size relative to screen height
-            size = random.uniform(base_size, base_size * 2) * (1 - 0.5 * abs(depth))
-            self.star_sizes.append(size)
-
-            # Initial visibility (some stars may be temporarily invisible)
-            self.star_visibility.append(random.random() > 0.1)  # 90% initially visible
-
-            # Flicker rate for quantum uncertainty visualization
-            self.star_flicker.append(random.uniform(0.02, 0.1))
-
-            # Mark some stars as special "Gödel stars" that behave paradoxically
-            # These stars will change in ways that contradict counting logic
-            self.star_godel_status.append(i % 8 == 0)  # Every 8th star is a "Gödel star"
+        # Generate positions inside jar
+        # Use an elliptical distribution to simulate 3D cylinder
+        angle = self.rng.uniform(0, 2 * math.pi, n).astype(DTYPE)
+        radius_factor = np.sqrt(self.rng.uniform(0, 0.95, n).astype(DTYPE))  # Square root for uniform distribution in circle
+
+        # Depth in the jar (for pseudo-3D)
+        self.star_depths = self.rng.uniform(-1.0, 1.0, n).astype(DTYPE)  # -1 is back, 1 is front
+
+        # Adjust radius based on depth to create 3D cylinder illusion
+        effective_width = self.jar_width * (0.5 + 0.5 * (1 - np.abs(self.star_depths)) ** 2)
+
+        # Calculate positions, one contiguous (x, y) row per star
+        self.star_xy = np.column_stack((
+            self.jar_center_x + radius_factor * effective_width / 2 * np.cos(angle),
+            jar_top + self.rng.uniform(0.1, 0.9, n) * self.jar_height,
+        )).astype(DTYPE)
+        self.star_pixel_y = self.star_xy[:, 1].astype(int)  # Rotation only moves stars sideways
+
+        # Size varies with depth and screen resolution
+        base_size = self.display_height * 0.005  # Base size relative to screen height
+        raw_sizes = self.rng.uniform(base_size, base_size * 2, n) * (1 - 0.5 * np.abs(self.star_depths))
+
+        # Snap sizes to thirds of the base size, so only a handful of sprite sizes ever exist
+        self.star_sizes = (np.clip(np.rint(raw_sizes / base_size * 3), 1, 8) * base_size / 3).astype(DTYPE)
+
+        # Initial visibility (some stars may be temporarily invisible)
+        self.star_visibility = self.rng.random(n) > 0.1  # 90% initially visible
+
+        # Flicker rate for quantum uncertainty visualization
+        self.star_flicker = self.rng.uniform(0.02, 0.1, n).astype(DTYPE)
+
+        # Mark some stars as special "Gödel stars" that behave paradoxically
+        # These stars will change in ways that contradict counting logic
+        self.star_godel_status = np.arange(n) % 8 == 0  # Every 8th star is a "Gödel star"
+
+        # Sprite lookup keys: snapped size in whole pixels, depth bucketed into brightness levels
+        self.star_size_levels = np.maximum(1, np.rint(self.star_sizes)).astype(int)
+        self.star_brightness = np.minimum(self.star_brightness_levels - 1,
+                                          ((self.star_depths + 1) / 2 * self.star_brightness_levels).astype(int))
+        self.star_sprite_keys = list(zip(self.star_size_levels.tolist(),
+                                         self.star_brightness.tolist(),
+                                         self.star_godel_status.tolist()))
+
+        # Bake every sprite these stars can need now rather than mid-animation
+        self.prerender_star_sprites()
+        self.update_jar_region()
+
+        # Depths never change after generation, so sort back to front once here
+        # (stable, so stars at equal depth keep a fixed order instead of swapping)
+        self.depth_order = np.argsort(self.star_depths, kind='stable').astype(np.int32)
+        self.update_draw_order()
+
+    def update_draw_order(self):
+        """Select the visible stars in depth order with one mask instead of per-star checks"""
+        visible = self.star_visibility[self.depth_order]
+        self.visible_draw_order = self.depth_order[visible].tolist()
+        self.visible_godel_order = self.depth_order[visible & self.star_godel_status[self.depth_order]].tolist()
+
+    def update_rotation_terms(self):
+        """Precompute the trig terms of the rotation angle shared by this frame's updates and drawing"""
+        angle = math.radians(self.rotation_angle)
+        self.sin_angle = math.sin(angle)
+        self.abs_sin_angle = abs(self.sin_angle)
+        self.sin_2angle = math.sin(2 * angle)
 
     def update_object_visibility(self):
         """Update which objects are visible (simulating quantum indeterminacy)"""
         # Update based on the rotation angle
-        angle_factor = abs(math.sin(math.radians(self.rotation_angle)))
+        angle_factor = self.abs_sin_angle
+
+        # Each rule draws one random number per star and flips visibility where it fires;
+        # flips compose by XOR, so the rules can be applied as whole-array masks
+        n = self.num_objects
+
+        # Regular quantum indeterminacy
+        flip = self.rng.random(n) < self.star_flicker
+
+        # Special behavior for "Gödel stars" - they behave paradoxically
+        # These stars are more likely to appear/disappear when you try to count them
+        if self.show_counting_attempt:
+            flip ^= self.star_godel_status & (self.rng.random(n) < 0.2)
 
-        for i in range(self.num_objects):
-            # Regular quantum indeterminacy
-            if random.random() < self.star_flicker[i]:
-                self.star_visibility[i] = not self.star_visibility[i]
+        # They also respond to viewing angle in counter-intuitive ways
+        if angle_factor > 0.7:
+            flip ^= self.star_godel_status & (self.rng.random(n) < 0.15)
 
-            # Special behavior for "Gödel stars" - they behave paradoxically
-            if self.star_godel_status[i]:
-                # These stars are more likely to appear/disappear when you try to count them
-                if self.show_counting_attempt and random.random() < 0.2:
-                    self.star_visibility[i] = not self.star_visibility[i]
+        self.star_visibility ^= flip
 
-                # They also respond to viewing angle in counter-intuitive ways
-                if angle_factor > 0.7 and random.random() < 0.15:
-                    self.star_visibility[i] = not self.star_visibility[i]
+        self.update_draw_order()
 
     def update_apparent_count(self):
         """Update the apparent count based on current view and Gödelian undecidability"""
-        # Count actually visible objects
-        true_visible = sum(self.star_visibility)
+        # Count actually visible objects (already gathered by update_draw_order)
+        true_visible = len(self.visible_draw_order)
 
         # Base angle-dependent factor
-        angle_factor = math.sin(math.radians(self.rotation_angle * 2))
+        angle_factor = self.sin_2angle
 
         # Gödel factor: the more precisely we try to count, the more uncertain it becomes
         godel_factor = 1.0
@@ -213,56 +307,133 @@ class GodelianJar:
         if self.show_counting_attempt and self.counting_progress > 50:
             self.counting_error = random.random() < 0.2  # 20% chance of counting error
 
-    def draw_star(self, x, y, size, depth, is_godel_star=False):
-        """Draw a 2D star with pseudo-3D effect based on depth"""
-        # Adjust color based on depth for 3D effect
+    def compute_star_color(self, brightness_level, base_color):
+        """Compute a star color for one brightness level"""
+        # Adjust color based on depth for 3D effect (depth at the centre of this level)
+        depth = (brightness_level + 0.5) / self.star_brightness_levels * 2 - 1
         brightness = int(200 * (0.5 + 0.5 * depth))  # Brighter in front
 
-        if is_godel_star:
-            # Gödel stars are golden/yellow to highlight their special nature
-            base_color = self.highlight_color
-        else:
-            base_color = self.star_color
+        return (min(255, base_color[0] + brightness // 3),
+                min(255, base_color[1] + brightness // 3),
+                min(255, base_color[2] + brightness // 3))
 
-        color = (min(255, base_color[0] + brightness // 3),
-                 min(255, base_color[1] + brightness // 3),
-                 min(255, base_color[2] + brightness // 3))
+    def render_star_sprite(self, size, brightness_level, is_godel_star=False, marked=False):
+        """Rasterize one star variant onto a small transparent surface"""
+        color = self.star_color_lut[is_godel_star][brightness_level]
 
-        # Draw a star shape
-        points = []
-        num_points = 5
-        inner_radius = size * 0.4
         outer_radius = size
+        half = int(math.ceil(outer_radius)) + 1
+        sprite = pygame.Surface((2 * half, 2 * half), pygame.SRCALPHA)
 
-        for i in range(num_points * 2):
-            angle = math.pi / num_points * i
-            radius = inner_radius if i % 2 else outer_radius
-            points.append((x + radius * math.sin(angle), y + radius * math.cos(angle)))
-
-        # Draw the star
-        if is_godel_star and self.show_counting_attempt:
-            # Add a subtle glow effect for Gödel stars when counting
-            glow_color = (min(255, color[0]), min(255, color[1]), min(255, color[2]))
-            glow_radius = outer_radius * 2
-            pygame.draw.circle(self.display, (glow_color[0] // 8, glow_color[1] // 8, glow_color[2] // 8),
-                               (int(x), int(y)), int(glow_radius))
-
-        pygame.draw.polygon(self.display, color, points)
+        # Draw a star shape by scaling and translating the unit star
+        points = (self.star_template * size + half).tolist()
+        pygame.draw.polygon(sprite, color, points)
 
         # For Gödel stars, add a small indicator when counting
-        if is_godel_star and self.show_counting_attempt:
+        if marked:
             # Add a small dot in the center to mark it
-            gfxdraw.filled_circle(self.display, int(x), int(y), 1, (255, 255, 255))
+            gfxdraw.filled_circle(sprite, half, half, 1, (255, 255, 255))
+
+        return sprite.convert_alpha()
+
+    def render_halo(self, size, brightness_level):
+        """Rasterize the glow around a Gödel star as a radial gradient for additive blitting"""
+        glow_radius = int(size * 2)
+        offsets = np.arange(-glow_radius, glow_radius + 1)
+        distance = np.hypot(offsets[:, np.newaxis], offsets[np.newaxis, :])
+        falloff = np.clip(1 - distance / max(glow_radius, 1), 0, 1)
+
+        # Additive blending adds raw RGB, so the falloff is baked into the color; a peak
+        # of 3/8 of the star color averages out to the old flat color // 8 glow disk
+        color = np.array(self.star_color_lut[True][brightness_level]) * 3 / 8
+        return pygame.surfarray.make_surface((falloff[..., np.newaxis] * color).astype(np.uint8)).convert()
+
+    def prerender_star_sprites(self):
+        """Rasterize all sprite variants used by the current stars and resolve each star's sprite"""
+        for size, brightness_level, is_godel_star in set(self.star_sprite_keys):
+            # Gödel stars also need their marked variant and glow for counting attempts
+            for marked in (False, True) if is_godel_star else (False,):
+                key = (size, brightness_level, is_godel_star, marked)
+                if key not in self.star_sprites:
+                    self.star_sprites[key] = self.render_star_sprite(*key)
+            if is_godel_star and (size, brightness_level) not in self.star_halos:
+                self.star_halos[(size, brightness_level)] = self.render_halo(size, brightness_level)
+
+        # Per-star sprite, centring offset and top row, with and without a counting attempt
+        self.star_draw_data = {}
+        for counting in (False, True):
+            sprites = [self.star_sprites[(size, brightness_level, is_godel_star, is_godel_star and counting)]
+                       for size, brightness_level, is_godel_star in self.star_sprite_keys]
+            halves = np.array([sprite.get_width() // 2 for sprite in sprites], dtype=int)
+            self.star_draw_data[counting] = (sprites, halves, (self.star_pixel_y - halves).tolist())
+
+        # The same for the glow drawn around Gödel stars during a counting attempt
+        halos = [self.star_halos.get((size, brightness_level))
+                 for size, brightness_level, _ in self.star_sprite_keys]
+        halves = np.array([halo.get_width() // 2 if halo else 0 for halo in halos], dtype=int)
+        self.star_halo_data = (halos, halves, (self.star_pixel_y - halves).tolist())
+
+    def update_jar_region(self):
+        """Recompute the rectangle holding everything drawn in and around the jar"""
+        # The body, grid and counting path stay inside the jar; stars reach past it by
+        # their rotation offset plus the widest sprite or glow around their centre
+        sprite_reach = max(max(halves.max(initial=0) for _, halves, _ in self.star_draw_data.values()),
+                           self.star_halo_data[1].max(initial=0))
+        star_reach = self.star_rotation_offset + sprite_reach + 4  # + odd sprite widths and the jar sides
+        self.jar_region = pygame.Rect(self.jar_center_x - self.jar_width // 2 - star_reach,
+                                      self.jar_center_y - self.jar_height // 2 - star_reach,
+                                      self.jar_width + 2 * star_reach,
+                                      self.jar_height + 2 * star_reach)
+
+    def draw_stars(self):
+        """Draw all visible stars with pseudo-3D effect in a single batched blit"""
+        sprites, halves, tops = self.star_draw_data[self.show_counting_attempt]
+
+        # Adjust x positions based on rotation to simulate 3D, computing all pixel
+        # positions in NumPy and handing plain Python ints to the blit list
+        rotation_offset = self.star_rotation_offset * self.sin_angle
+        centers = (self.star_xy[:, 0] + rotation_offset * self.star_depths).astype(int)
+        lefts = (centers - halves).tolist()
+
+        # Add a subtle glow around Gödel stars when counting, underneath all the stars
+        if self.show_counting_attempt:
+            halos, halo_halves, halo_tops = self.star_halo_data
+            halo_lefts = (centers - halo_halves).tolist()
+            self.display.blits([(halos[idx], (halo_lefts[idx], halo_tops[idx]), None, pygame.BLEND_RGB_ADD)
+                                for idx in self.visible_godel_order], doreturn=False)
+
+        # Blit the visible stars in precomputed depth order (paint back to front)
+        self.display.blits([(sprites[idx], (lefts[idx], tops[idx])) for idx in self.visible_draw_order],
+                           doreturn=False)
+
+    def render_jar_rim(self, effective_width):
+        """Rasterize the elliptical jar rim (used for both top and bottom) at one apparent width"""
+        surface = pygame.Surface((effective_width, 20), pygame.SRCALPHA)
+        pygame.draw.ellipse(surface, self.jar_outline_color, (0, 0, effective_width, 20))
+        return surface.convert_alpha()
+
+    def render_grid_surfaces(self):
+        """Rasterize the vertical and the horizontal lines of the formal-system grid at the full jar width"""
+        verticals = pygame.Surface((self.jar_width, self.jar_height), pygame.SRCALPHA)
+        horizontals = pygame.Surface((self.jar_width, self.jar_height), pygame.SRCALPHA)
+        jar_width = self.jar_width // 2 * 2
+        jar_height = self.jar_height // 2 * 2
+
+        # The lines are opaque: alpha in a color is ignored when drawing straight onto the display
+        for x in range(20, jar_width, self.grid_spacing):
+            pygame.draw.line(verticals, self.grid_color, (x, 20), (x, jar_height - 20), 1)
+        for y in range(20, jar_height, self.grid_spacing):
+            pygame.draw.line(horizontals, self.grid_color, (20, y), (jar_width - 40, y), 1)
+
+        return verticals.convert_alpha(), horizontals.convert_alpha()
 
     def draw_jar(self):
         """Draw a pseudo-3D jar"""
-        jar_left = self.jar_center_x - self.jar_width // 2
-        jar_right = self.jar_center_x + self.jar_width // 2
         jar_top = self.jar_center_y - self.jar_height // 2
         jar_bottom = self.jar_center_y + self.jar_height // 2
 
         # Calculate the jar's elliptical appearance based on rotation angle
-        squeeze_factor = 0.25 * (1 - abs(math.sin(math.radians(self.rotation_angle))))
+        squeeze_factor = 0.25 * (1 - self.abs_sin_angle)
         effective_width = int(self.jar_width * (1 - squeeze_factor))
 
         # Calculate new left and right positions
@@ -270,13 +441,12 @@ class GodelianJar:
         jar_right_adjusted = self.jar_center_x + effective_width // 2
 
         # Draw jar - semitransparent blue
-        s = pygame.Surface((effective_width, self.jar_height), pygame.SRCALPHA)
-        s.fill((70, 130, 180, 50))  # Semi-transparent blue
-        self.display.blit(s, (jar_left_adjusted, jar_top))
+        self.display.blit(self.jar_fill, (jar_left_adjusted, jar_top),
+                          pygame.Rect(0, 0, effective_width, self.jar_height))
 
-        # Draw jar outline
-        pygame.draw.ellipse(self.display, self.jar_outline_color,
-                            (jar_left_adjusted, jar_top, effective_width, 20))  # Top rim
+        # Draw jar outline (the rims only depend on the apparent width, so they are prerendered)
+        jar_rim = self.jar_rims[effective_width]
+        self.display.blit(jar_rim, (jar_left_adjusted, jar_top))  # Top rim
 
         # Draw left and right sides
         pygame.draw.line(self.display, self.jar_outline_color,
@@ -285,8 +455,7 @@ class GodelianJar:
                          (jar_right_adjusted, jar_top + 10), (jar_right_adjusted, jar_bottom), 2)
 
         # Draw elliptical bottom
-        pygame.draw.ellipse(self.display, self.jar_outline_color,
-                            (jar_left_adjusted, jar_bottom - 10, effective_width, 20))
+        self.display.blit(jar_rim, (jar_left_adjusted, jar_bottom - 10))
 
         # Draw some horizontal lines to enhance the 3D appearance
         for i in range(1, 10):
@@ -300,41 +469,49 @@ class GodelianJar:
         # Draw a grid inside the jar to represent "formal system boundaries"
         # This grid represents the axiomatic framework we're working within
         if random.random() < 0.3:  # Only show occasionally for effect
-            grid_spacing = 30
-            grid_alpha = 40 + int(15 * math.sin(math.radians(self.rotation_angle * 3)))
-
-            for x in range(jar_left_adjusted + 20, jar_right_adjusted, grid_spacing):
-                # Vertical lines
-                pygame.draw.line(self.display, self.grid_color + (grid_alpha,),
-                                 (x, jar_top + 20), (x, jar_bottom - 20), 1)
-
-            for y in range(jar_top + 20, jar_bottom, grid_spacing):
-                # Horizontal lines
-                line_width = jar_right_adjusted - jar_left_adjusted - 40
-                pygame.draw.line(self.display, self.grid_color + (grid_alpha,),
-                                 (jar_left_adjusted + 20, y), (jar_left_adjusted + line_width, y), 1)
+            # Vertical lines, cropped to the apparent width
+            self.display.blit(self.grid_verticals, (jar_left_adjusted, jar_top),
+                              pygame.Rect(0, 0, effective_width // 2 * 2, self.jar_height))
+
+            # Horizontal lines, cropped to end 40 px short of the right side
+            line_width = effective_width // 2 * 2 - 40
+            self.display.blit(self.grid_horizontals, (jar_left_adjusted, jar_top),
+                              pygame.Rect(0, 0, line_width + 1, self.jar_height))
+
+    def update_axiom_boundaries(self):
+        """Drift the axiom boundaries for the current rotation angle"""
+        phases = np.radians(self.rotation_angle * self.axiom_speeds)
+        self.axiom_positions[:, 0] += np.cos(phases) * 0.5
+        self.axiom_positions[:, 1] += np.sin(phases) * 0.5
+        self.update_axiom_appearance(phases)
+
+    def update_axiom_appearance(self, phases):
+        """Derive the centres and shimmer colours draw_axiom_boundaries needs, as plain Python values"""
+        self.axiom_centers = self.axiom_positions.astype(int).tolist()
+        color_pulses = 127 + 127 * np.sin(phases * 5)
+        self.axiom_colors = [(30, 30, blue) for blue in np.minimum(200, 50 + color_pulses.astype(int)).tolist()]
 
     def draw_axiom_boundaries(self):
         """Draw visualization of formal system boundaries"""
-        # Update the positions of the axiom boundaries
-        for boundary in self.axiom_boundaries:
-            boundary['x'] += math.cos(math.radians(self.rotation_angle * boundary['speed'])) * 0.5
-            boundary['y'] += math.sin(math.radians(self.rotation_angle * boundary['speed'])) * 0.5
+        # Connect axioms with lines to show their relationships
+        self.dirty_rects.append(pygame.draw.lines(self.display, (20, 20, 80, 100), False, self.axiom_centers, 1))
 
         # Draw the boundaries as shimmering circles that intersect
-        for i, boundary in enumerate(self.axiom_boundaries):
-            color_pulse = int(127 + 127 * math.sin(math.radians(self.rotation_angle * boundary['speed'] * 5)))
-            boundary_color = (30, 30, min(200, 50 + color_pulse))
+        for center, size, boundary_color in zip(self.axiom_centers, self.axiom_sizes, self.axiom_colors):
+            self.dirty_rects.append(pygame.draw.circle(self.display, boundary_color, center, size, 1))
 
-            pygame.draw.circle(self.display, boundary_color,
-                               (int(boundary['x']), int(boundary['y'])), boundary['size'], 1)
+    def compute_counting_path(self, progress):
+        """Compute the points of the increasingly chaotic counting path at a given progress (in %)"""
+        count_percentage = progress / 100.0
+        radius = self.jar_width * 0.3
 
-            # Connect axioms with lines to show their relationships
-            if i < len(self.axiom_boundaries) - 1:
-                next_boundary = self.axiom_boundaries[i + 1]
-                pygame.draw.line(self.display, (20, 20, 80, 100),
-                                 (int(boundary['x']), int(boundary['y'])),
-                                 (int(next_boundary['x']), int(next_boundary['y'])), 1)
+        i = np.arange(20) / 20
+        angle = i * count_percentage * math.pi * 4
+        # As count progresses, the path gets more chaotic
+        chaos = 1.0 + count_percentage * 5.0 * i
+        x = self.jar_center_x + radius * np.cos(angle) * (1 + 0.2 * np.sin(chaos * angle))
+        y = self.jar_center_y + radius * np.sin(angle) * (1 + 0.2 * np.cos(chaos * angle))
+        return np.column_stack((x, y)).tolist()
 
     def draw_undecidability_visualization(self):
         """Draw additional visual elements to represent undecidability"""
@@ -342,30 +519,16 @@ class GodelianJar:
         if not self.show_counting_attempt:
             return
 
-        # Draw a "counting path" that tries to count stars but gets confused
-        jar_center_x = self.jar_center_x
-        jar_center_y = self.jar_center_y
-
-        # Calculate the percentage of stars we've attempted to count
-        count_percentage = self.counting_progress / 100.0
+        # Draw a "counting path" that tries to count stars but gets confused. The path
+        # only depends on the progress, so recompute it once per whole percent
+        path_key = round(self.counting_progress)
+        if path_key != self.counting_path_key:
+            self.counting_path = self.compute_counting_path(path_key)
+            self.counting_path_key = path_key
 
-        # Draw an increasingly chaotic counting path
-        points = []
-        radius = self.jar_width * 0.3
-        for i in range(20):
-            angle = i / 20 * count_percentage * math.pi * 4
-            # As count progresses, the path gets more chaotic
-            chaos = 1.0 + count_percentage * 5.0 * (i / 20)
-            x = jar_center_x + radius * math.cos(angle) * (1 + 0.2 * math.sin(chaos * angle))
-            y = jar_center_y + radius * math.sin(angle) * (1 + 0.2 * math.cos(chaos * angle))
-            points.append((x, y))
-
-        # Draw lines connecting the points
-        if len(points) > 1:
-            # Make line fade as the counting error increases
-            line_color = (200, 200, 200, max(50, 255 - int(self.counting_progress * 2)))
-            for i in range(len(points) - 1):
-                pygame.draw.line(self.display, line_color, points[i], points[i + 1], 1)
+        # Make line fade as the counting error increases
+        line_color = (200, 200, 200, max(50, 255 - int(self.counting_progress * 2)))
+        pygame.draw.lines(self.display, line_color, False, self.counting_path, 1)
 
         # If counting error, draw error indicators
         if self.counting_error:
@@ -374,8 +537,8 @@ class GodelianJar:
 
             # Draw X symbols to indicate counting errors
             for _ in range(3):
-                x = jar_center_x + random.randint(-self.jar_width // 3, self.jar_width // 3)
-                y = jar_center_y + random.randint(-self.jar_height // 3, self.jar_height // 3)
+                x = self.jar_center_x + random.randint(-self.jar_width // 3, self.jar_width // 3)
+                y = self.jar_center_y + random.randint(-self.jar_height // 3, self.jar_height // 3)
 
                 # Draw X
                 size = random.randint(5, 15)
@@ -389,7 +552,18 @@ class GodelianJar:
         if color is None:
             color = self.text_color
 
-        text_surface = font.render(text, True, color)
+        # Rasterizing text is expensive, so reuse surfaces for strings we have already drawn.
+        # The count and progress lines only change every few frames, so nearly every call is a hit
+        key = (text, font, color)
+        text_surface = self.text_cache.get(key)
+        if text_surface is None:
+            if len(self.text_cache) >= self.text_cache_size:
+                self.text_cache.popitem(last=False)
+            # Convert once to the display's pixel format so the per-frame blit is a plain copy
+            text_surface = font.render(text, True, color).convert_alpha()
+            self.text_cache[key] = text_surface
+        else:
+            self.text_cache.move_to_end(key)
 
         # Adjust position based on alignment
         if align == 'center':
@@ -397,37 +571,26 @@ class GodelianJar:
         elif align == 'right':
             position = (position[0] - text_surface.get_width(), position[1])
 
-        self.display.blit(text_surface, position)
+        self.dirty_rects.append(self.display.blit(text_surface, position))
         return text_surface.get_height()
 
     def render_frame(self):
         """Render a single frame of the animation"""
-        # Clear the screen
+        # Clear the screen (one full fill is cheaper than partial clears here)
         self.display.fill(self.background_color)
 
+        # Regions drawn this frame (the jar area, every text line and the axiom shapes);
+        # together with the previous frame's, these are the only parts that can change
+        self.dirty_rects = [self.jar_region]
+
         # Draw axiom boundaries in the background
         self.draw_axiom_boundaries()
 
         # Draw the jar
         self.draw_jar()
 
-        # Sort stars by depth for proper rendering (paint back to front)
-        depth_sorted_indices = sorted(range(len(self.stars)),
-                                      key=lambda i: self.star_depths[i])
-
         # Draw the stars
-        for idx in depth_sorted_indices:
-            if self.star_visibility[idx]:
-                x, y = self.stars[idx]
-                size = self.star_sizes[idx]
-                depth = self.star_depths[idx]
-                is_godel_star = self.star_godel_status[idx]
-
-                # Adjust x position based on rotation to simulate 3D
-                rotation_offset = 30 * math.sin(math.radians(self.rotation_angle)) * self.star_depths[idx]
-                x_adjusted = x + rotation_offset
-
-                self.draw_star(x_adjusted, y, size, depth, is_godel_star)
+        self.draw_stars()
 
         # Draw undecidability visualization
         self.draw_undecidability_visualization()
@@ -476,14 +639,12 @@ class GodelianJar:
             next_section_y = text_start_y + count_height + section_spacing
 
         # Render the current Gödel statement with fading effect
-        statement = self.godel_statements[self.current_statement]
-        statement_height = self.render_text(
-            f"Gödel's Insight: {statement}",
-            (self.display_width // 2, next_section_y),
-            self.display_font,
-            (self.text_color[0], self.text_color[1], self.text_color[2], self.statement_fade),
-            align='center'
-        )
+        # (font.render ignores alpha in the color, so the fade is applied to the surface)
+        statement_surface = self.statement_surfaces[self.current_statement]
+        statement_surface.set_alpha(self.statement_fade)
+        self.dirty_rects.append(self.display.blit(
+            statement_surface, (self.display_width // 2 - statement_surface.get_width() // 2, next_section_y)))
+        statement_height = statement_surface.get_height()
 
         # Render explanation
         explanation = [
@@ -513,8 +674,14 @@ class GodelianJar:
             align='center'
         )
 
-        # Update the display
-        pygame.display.flip()
+        # Update the display, pushing only the changed regions (this frame's and
+        # the previous frame's, so moved elements are erased) unless a full redraw is due
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.dirty_rects + self.previous_dirty_rects)
+        self.previous_dirty_rects = self.dirty_rects
 
     def run_animation(self):
         """Run the main animation loop"""
@@ -555,11 +722,19 @@ class GodelianJar:
                     elif event.key == pygame.K_f:
                         # Toggle fullscreen
                         pygame.display.toggle_fullscreen()
+                        self.full_redraw = True
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # The window contents were lost, so the next frame must repaint everything
+                    self.full_redraw = True
 
             # Update rotation
             self.rotation_angle += self.rotation_speed
             if self.rotation_angle >= 360:
                 self.rotation_angle = 0
+            self.update_rotation_terms()
+
+            # Move the axiom boundaries (drawing them only renders the current state)
+            self.update_axiom_boundaries()
 
             # Update object visibility and count periodically
             if frame_count % self.count_update_interval == 0:
@@ -590,7 +765,10 @@ class GodelianJar:
             self.render_frame()
 
             frame_count += 1
-            self.clock.tick(60)  # Limit to 60 FPS
+            # Limit to 60 FPS. tick() sleeps away the rest of the frame budget (unlike
+            # tick_busy_loop), and since the jar rotates and the axioms drift every frame
+            # there is never an idle frame that could skip rendering altogether
+            self.clock.tick(60)
 
             # Print debug info occasionally
             if self.debug_mode and frame_count % 120 == 0: